@@ -1,100 +1,15 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-from io import BytesIO
+from viz_core import (
+    apply_theme, corr, describe, download_png, dtypes, load_data, null_counts, numeric_view,
+    plot_box, plot_count, plot_heatmap, plot_histogram, plot_line, plot_scatter, style_rc,
+    top_correlations, total_nulls, viz_libs,
+)
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="Smart Data Visualizer", page_icon="📊", layout="wide")
 
 # ---------------- CUSTOM CSS ----------------
-# ---------------- CUSTOM CSS ----------------
-st.markdown("""
-    <style>
-    /* ---------- Global App Styling ---------- */
-    .stApp {
-        background-color: #F1F8E9;
-        font-family: 'Poppins', sans-serif;
-        color: orangered;
-    }
-
-    /* ---------- Sidebar ---------- */
-    section[data-testid="stSidebar"] {
-        background-color: #C8E6C9;
-        border-right: 2px solid #A5D6A7;
-    }
-
-    /* ---------- Headings ---------- */
-    h1, h2, h3, h4 ,p{
-        color: blue;
-        font-weight: 600;
-    }
-
-    /* ---------- Buttons ---------- */
-    button[data-testid="baseButton-secondary"] {
-        background-color: #00897B !important;
-        color: blue !important;
-        border-radius: 8px !important;
-        border: none !important;
-        font-weight: 600 !important;
-    }
-    button[data-testid="baseButton-secondary"]:hover {
-        background-color: #00796B !important;
-    }
-
-    /* ---------- Download Button ---------- */
-    div.stDownloadButton > button {
-        background-color: white;
-        color: white !important;
-        border-radius: 10px;
-        font-weight: 100;
-    }
-    div.stDownloadButton > button:hover {
-        background-color: #00796B;
-    }
-
-    /* ---------- Dataframes ---------- */
-    .stDataFrame {
-        border-radius: 10px !important;
-    }
-
-    /* ---------- Expander ---------- */
-    .streamlit-expanderHeader {
-        background-color: #E8F5E9 !important;
-        font-weight: 600;
-        color: blue !important;
-    }
-
-    /* ---------- Metrics ---------- */
-    [data-testid="stMetricValue"] {
-        color: blue;
-        font-weight: 700;
-    }
-
-    /* ---------- Select Boxes ---------- */
-    div[data-baseweb="select"] > div {
-        background-color: #FFFFFF !important;
-        border-radius: 8px !important;
-        color: #000000 !important;   /* Ensures black text */
-    }
-
-    /* Text inside dropdown menu */
-    div[data-baseweb="popover"] * {
-        color: #000000 !important;
-    }
-
-    /* Dropdown background */
-    div[data-baseweb="popover"] {
-        background-color: #FFFFFF !important;
-    }
-
-    /* ---------- Footer ---------- */
-    footer {
-        visibility: hidden;
-    }
-    </style>
-""", unsafe_allow_html=True)
+apply_theme()
 
 
 # ---------------- SIDEBAR ----------------
@@ -105,15 +20,8 @@ uploaded_file = st.sidebar.file_uploader("Upload your CSV or Excel file", type=[
 st.title("📊 Smart Data Visualizer")
 st.write("Upload your dataset and generate instant insights & visualizations.")
 
-# ---------------- LOAD DATA ----------------
-@st.cache_data
-def load_data(uploaded_file):
-    if uploaded_file.name.endswith(".csv"):
-        return pd.read_csv(uploaded_file)
-    else:
-        return pd.read_excel(uploaded_file)
-
 if uploaded_file:
+    _, plt = viz_libs()
     df = load_data(uploaded_file)
     st.success("✅ File uploaded successfully!")
 
@@ -126,78 +34,84 @@ if uploaded_file:
     col1, col2, col3 = st.columns(3)
     col1.metric("Rows", df.shape[0])
     col2.metric("Columns", df.shape[1])
-    col3.metric("Missing Values", df.isnull().sum().sum())
+    col3.metric("Missing Values", total_nulls(df, uploaded_file.file_id))
 
     with st.expander("🔍 Data Types & Missing Values"):
-        st.write(df.dtypes)
-        st.write("Missing Values per Column:")
-        st.write(df.isnull().sum())
+        if st.checkbox("Show data types & missing values"):
+            st.write(dtypes(df, uploaded_file.file_id))
+            st.write("Missing Values per Column:")
+            st.write(null_counts(df, uploaded_file.file_id))
 
     with st.expander("📊 Descriptive Statistics"):
-        st.write(df.describe())
+        if st.checkbox("Show stats"):
+            st.write(describe(df, uploaded_file.file_id))
 
     # ---------------- VISUALIZATION ----------------
     st.subheader("🎨 Visualization Playground")
 
-    numeric_cols = df.select_dtypes(include=np.number).columns.tolist()
-    all_cols = df.columns.tolist()
+    # Session-cached per upload, so reruns don't rescan dtypes
+    numeric_cols, num_arr = numeric_view(df, uploaded_file.file_id)
 
     chart_type = st.selectbox(
         "Select a chart type",
         ["Scatter Plot", "Line Chart", "Histogram", "Box Plot", "Correlation Heatmap", "Count Plot"]
     )
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    plt.style.use("seaborn-v0_8-whitegrid")
+    # Reuse one Figure per session instead of allocating a new one each rerun
+    if "fig" not in st.session_state:
+        plt.rcParams.update(style_rc())
+        st.session_state.fig, st.session_state.ax = plt.subplots(figsize=(8, 5), constrained_layout=True)
+        plt.close(st.session_state.fig)
+    fig, ax = st.session_state.fig, st.session_state.ax
+    # Drop colorbars left over from a previous heatmap before clearing
+    for extra in fig.axes:
+        if extra is not ax:
+            extra.remove()
+    ax.clear()
+    # clear() keeps tick parameters, so undo the Count Plot's label rotation
+    ax.tick_params(axis="x", labelrotation=0)
+    # imshow leaves an equal aspect behind, which squashes later charts
+    ax.set_aspect("auto")
 
     if chart_type == "Scatter Plot":
         x = st.selectbox("X-axis", numeric_cols)
         y = st.selectbox("Y-axis", numeric_cols)
-        sns.scatterplot(data=df, x=x, y=y, ax=ax, color="#00897B")
+        plot_scatter(df, x, y, ax)
 
     elif chart_type == "Line Chart":
-        x = st.selectbox("X-axis", all_cols)
+        x = st.selectbox("X-axis", df.columns.tolist())
         y = st.selectbox("Y-axis", numeric_cols)
-        sns.lineplot(data=df, x=x, y=y, ax=ax, color="#00897B")
+        plot_line(df, x, y, ax)
 
     elif chart_type == "Histogram":
         column = st.selectbox("Select Column", numeric_cols)
-        sns.histplot(df[column], kde=True, ax=ax, color="#00897B")
+        # No numeric columns leaves the selectbox at None; draw an empty chart
+        if column is not None:
+            plot_histogram(num_arr[:, numeric_cols.index(column)], uploaded_file.file_id, column, ax)
 
     elif chart_type == "Box Plot":
         column = st.selectbox("Select Column", numeric_cols)
-        sns.boxplot(data=df, y=column, ax=ax, color="#00897B")
+        if column is not None:
+            plot_box(num_arr[:, numeric_cols.index(column)], uploaded_file.file_id, column, ax)
 
     elif chart_type == "Count Plot":
-        column = st.selectbox("Select Column", all_cols)
-        sns.countplot(data=df, x=column, ax=ax, color="#00897B")
-        plt.xticks(rotation=45)
+        column = st.selectbox("Select Column", df.columns.tolist())
+        plot_count(df, uploaded_file.file_id, column, ax)
 
     elif chart_type == "Correlation Heatmap":
-        sns.heatmap(df.corr(), annot=True, cmap="Greens", ax=ax)
+        plot_heatmap(corr(num_arr, uploaded_file.file_id, tuple(numeric_cols)), ax)
 
     st.pyplot(fig)
 
     # ---------------- DOWNLOAD CHART ----------------
-    buf = BytesIO()
-    fig.savefig(buf, format="png")
-    st.download_button(
-        label="📥 Download Chart as PNG",
-        data=buf.getvalue(),
-        file_name="chart.png",
-        mime="image/png"
-    )
+    download_png(fig)
 
     # ---------------- AUTO INSIGHTS ----------------
     st.subheader("🧠 Quick Insights")
     if len(numeric_cols) >= 2:
-        corr_matrix = df[numeric_cols].corr()
-        top_corr = (
-            corr_matrix.abs().unstack().sort_values(ascending=False)
-            .drop_duplicates().head(5)
-        )
+        C = corr(num_arr, uploaded_file.file_id, tuple(numeric_cols)).to_numpy()
         st.write("Top Correlated Features:")
-        st.write(top_corr)
+        st.write(top_correlations(C, numeric_cols))
 
 else:
     st.info("👆 Upload a CSV or Excel file to get started.")
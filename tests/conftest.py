@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def clear_data_cache():
+    # Cached helpers are keyed on an upload id, so don't let entries leak between tests
+    st.cache_data.clear()
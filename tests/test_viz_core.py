@@ -0,0 +1,269 @@
+import sys
+import types
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib import cbook
+from streamlit.proto.Common_pb2 import FileURLs
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+import viz_core
+from viz_core import (
+    box_stats, describe, fast_corr, hist_kde_column, load_data, null_counts, plot_count, plot_line,
+    top_correlations, total_nulls, viz_libs,
+)
+
+COLUMNS = {
+    "normal": np.random.default_rng(0).normal(10, 3, size=500),
+    "with_nan": np.array([1.0, np.nan, 4.0, 2.5, np.nan, 8.0, -3.0]),
+    "constant": np.full(20, 7.0),
+    "single": np.array([3.5]),
+}
+
+
+def _numeric_frame():
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=200)
+    df = pd.DataFrame({
+        "a": base,
+        "b": base * 0.8 + rng.normal(scale=0.5, size=200),
+        "c": rng.normal(size=200),
+        "d": -base + rng.normal(scale=2.0, size=200),
+        "e": rng.normal(size=200),
+    })
+    df.loc[[3, 50, 120], "c"] = np.nan
+    return df
+
+UPLOAD_FRAME = pd.DataFrame({
+    "id": [1, 2, 3, 4, 5],
+    "day": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"],
+    "name": ["a", "b", "c", "a", "b"],
+    "val": [1.5, 2.5, np.nan, 4.0, 3.0],
+})
+
+def _upload(ext):
+    buf = BytesIO()
+    if ext == "csv":
+        UPLOAD_FRAME.to_csv(buf, index=False)
+    else:
+        UPLOAD_FRAME.to_excel(buf, index=False)
+    name = f"data.{ext}"
+    return UploadedFile(UploadedFileRec(name, name, "", buf.getvalue()), FileURLs())
+
+
+# ---------------- load_data / plots ----------------
+@pytest.mark.parametrize("ext", ["csv", "xlsx"])
+def test_load_data_returns_numpy_dtypes(ext):
+    df = load_data(_upload(ext))
+    assert not any(isinstance(t, pd.ArrowDtype) for t in df.dtypes)
+    assert df["id"].dtype == np.int8
+    assert df["val"].dtype == np.float32
+    assert df["val"].isna().sum() == 1
+
+@pytest.mark.parametrize("ext", ["csv", "xlsx"])
+@pytest.mark.parametrize("x", ["id", "day", "name"])
+def test_plot_line_on_loaded_upload(ext, x):
+    df = load_data(_upload(ext))
+    _, plt = viz_libs()
+    fig, ax = plt.subplots()
+    try:
+        plot_line(df, x, "val", ax)
+        assert len(ax.lines) == 1
+    finally:
+        plt.close(fig)
+
+@pytest.mark.parametrize("ext", ["csv", "xlsx"])
+@pytest.mark.parametrize("column", ["day", "name"])
+def test_plot_count_on_loaded_upload(ext, column):
+    df = load_data(_upload(ext))
+    _, plt = viz_libs()
+    fig, ax = plt.subplots()
+    try:
+        plot_count(df, "upload", column, ax)
+        heights = [p.get_height() for p in ax.patches]
+        assert len(heights) == df[column].nunique()
+        assert sum(heights) == len(df)
+    finally:
+        plt.close(fig)
+
+
+# ---------------- missing values ----------------
+def test_null_counts_follow_the_upload_key():
+    # 60k rows is past the size where st.cache_data only samples a frame
+    df = pd.DataFrame({"a": np.zeros(60_000), "b": np.ones(60_000)})
+    assert null_counts(df, "upload-1").tolist() == [0, 0]
+    df.loc[123, "a"] = np.nan
+    assert null_counts(df, "upload-2").tolist() == [1, 0]
+
+def test_total_nulls_follow_the_upload_key():
+    df = pd.DataFrame({"a": np.zeros(60_000), "b": np.ones(60_000)})
+    assert total_nulls(df, "upload-1") == 0
+    df.loc[[7, 59_000], "b"] = np.nan
+    assert total_nulls(df, "upload-2") == 2
+
+
+# ---------------- describe ----------------
+@pytest.mark.parametrize("name", COLUMNS)
+def test_describe_matches_pandas(name):
+    values = COLUMNS[name]
+    df = pd.DataFrame({"a": values, "b": values[::-1] * 2, "label": ["x"] * len(values)})
+    pd.testing.assert_frame_equal(describe(df, "upload"), df.describe(), check_dtype=False)
+
+def test_describe_arrow_backed_frame():
+    df = pd.DataFrame({"a": [1.0, None, 3.0, 4.0], "b": [1, 2, 2, 5]}).convert_dtypes(dtype_backend="pyarrow")
+    expected = df.astype("float64").describe()
+    pd.testing.assert_frame_equal(describe(df, "upload"), expected, check_dtype=False)
+
+def test_describe_all_nan_column():
+    df = pd.DataFrame({"a": [np.nan, np.nan, np.nan], "b": [1.0, 2.0, 3.0]})
+    pd.testing.assert_frame_equal(describe(df, "upload"), df.describe(), check_dtype=False)
+
+@pytest.mark.parametrize("backend", ["numpy_nullable", "pyarrow"])
+def test_describe_keeps_datetime_columns(backend):
+    df = pd.DataFrame({
+        "a": [1.0, 2.0, 4.0],
+        "t": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"]),
+    })
+    if backend == "pyarrow":
+        df = df.convert_dtypes(dtype_backend="pyarrow")
+    result = describe(df, "upload")
+    assert list(result.columns) == ["a", "t"]
+    pd.testing.assert_frame_equal(result, df.describe())
+
+def test_describe_follows_the_upload_key():
+    df = pd.DataFrame({"a": np.zeros(60_000)})
+    assert describe(df, "upload-1").loc["max", "a"] == 0
+    df.loc[0, "a"] = 5.0
+    assert describe(df, "upload-2").loc["max", "a"] == 5.0
+
+def test_describe_without_numeric_columns_falls_back():
+    df = pd.DataFrame({"label": ["x", "y", "x"]})
+    pd.testing.assert_frame_equal(describe(df, "upload"), df.describe())
+
+
+# ---------------- correlations ----------------
+def test_fast_corr_uses_pairwise_complete_rows():
+    df = _numeric_frame()
+    cols = df.columns.tolist()
+    result = fast_corr(df.to_numpy(dtype=np.float32), cols)
+    pd.testing.assert_frame_equal(result, df.corr(), check_dtype=False, rtol=1e-5)
+
+def test_fast_corr_sparse_column_only_affects_its_own_pairs():
+    df = _numeric_frame()
+    sparse = np.full(len(df), np.nan)
+    sparse[::20] = np.random.default_rng(3).normal(size=sparse[::20].size)
+    df["sparse"] = sparse
+    result = fast_corr(df.to_numpy(dtype=np.float32), df.columns)
+    # Dropping incomplete rows would leave only the sparse column's ten rows for every pair
+    pd.testing.assert_frame_equal(result, df.corr(), check_dtype=False, rtol=1e-4, atol=1e-6)
+
+def test_fast_corr_constant_column_is_nan():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 5.0], "k": [4.0] * 4, "b": [2.0, 1.0, 4.0, 3.0]})
+    result = fast_corr(df.to_numpy(dtype=np.float32), df.columns)
+    assert result["k"].isna().all()
+    assert result.loc["a", "b"] == pytest.approx(df["a"].corr(df["b"]), rel=1e-5)
+
+def test_fast_corr_falls_back_when_gpu_fails(monkeypatch):
+    def broken_corrcoef(*args, **kwargs):
+        raise RuntimeError("cudaErrorNoDevice")
+    fake = types.SimpleNamespace(
+        cuda=types.SimpleNamespace(runtime=types.SimpleNamespace(getDeviceCount=lambda: 1)),
+        asarray=np.asarray,
+        corrcoef=broken_corrcoef,
+    )
+    monkeypatch.setitem(sys.modules, "cupy", fake)
+    viz_core._cupy.clear()
+    try:
+        a = np.random.default_rng(2).normal(size=(viz_core.GPU_CORR_MIN_SIZE // 2 + 1, 2)).astype(np.float32)
+        result = fast_corr(a, ["x", "y"])
+    finally:
+        viz_core._cupy.clear()
+    np.testing.assert_allclose(result.to_numpy(), np.corrcoef(a, rowvar=False), rtol=1e-4, atol=1e-6)
+
+def _reference_top(df, k):
+    # The pandas unstack/sort ranking, restricted to the strict upper triangle
+    c = df.corr().abs()
+    upper = c.where(np.triu(np.ones(c.shape, dtype=bool), k=1))
+    return upper.stack().dropna().sort_values(ascending=False).head(k)
+
+@pytest.mark.parametrize("k", [1, 3, 5, 10, 20])
+def test_top_correlations_matches_pandas(k):
+    df = _numeric_frame().dropna()
+    cols = df.columns.tolist()
+    result = top_correlations(df.corr().to_numpy(), cols, k=k)
+    expected = _reference_top(df, k)
+    assert list(zip(result["Feature 1"], result["Feature 2"])) == list(expected.index)
+    np.testing.assert_allclose(result["|Correlation|"], expected.to_numpy())
+
+def test_top_correlations_skips_constant_and_nan_pairs():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 5.0], "k": [4.0] * 4, "b": [2.0, 1.0, 4.0, 3.0]})
+    C = fast_corr(df.to_numpy(dtype=np.float32), df.columns).to_numpy()
+    result = top_correlations(C, df.columns.tolist())
+    assert list(zip(result["Feature 1"], result["Feature 2"])) == [("a", "b")]
+    assert not result["|Correlation|"].isna().any()
+
+def test_top_correlations_empty_when_no_valid_pair():
+    C = np.array([[1.0, np.nan], [np.nan, np.nan]])
+    result = top_correlations(C, ["a", "k"])
+    assert result.empty
+    assert list(result.columns) == ["Feature 1", "Feature 2", "|Correlation|"]
+
+
+# ---------------- box_stats ----------------
+@pytest.mark.parametrize("name", COLUMNS)
+def test_box_stats_matches_matplotlib(name):
+    values = COLUMNS[name].astype(np.float32)
+    stats = box_stats(values, "upload", name)
+    expected = cbook.boxplot_stats(values[~np.isnan(values)], whis=1.5)[0]
+    assert stats["label"] == name
+    for key in ("med", "q1", "q3", "whislo", "whishi"):
+        assert stats[key] == pytest.approx(expected[key], rel=1e-6), key
+
+def test_box_stats_follow_the_upload_key():
+    # 600k elements is past the size where st.cache_data only samples an array
+    a = np.arange(600_000, dtype=np.float32)
+    assert box_stats(a, "upload-1", "a")["whishi"] == 599_999
+    a[-1] = 1e9
+    assert box_stats(a, "upload-2", "a")["whishi"] == 599_998
+
+def test_box_stats_all_nan_is_none():
+    assert box_stats(np.full(4, np.nan, dtype=np.float32), "upload", "empty") is None
+
+
+# ---------------- hist_kde_column ----------------
+def _reference_kde(a, grid):
+    # Silverman bandwidth and Gaussian kernel, evaluated directly over every sample
+    std = a.std(ddof=1)
+    q1, q3 = np.percentile(a, [25, 75])
+    bw = 0.9 * min(std, (q3 - q1) / 1.34) * a.size ** -0.2
+    z = (grid[:, None] - a[None, :]) / bw
+    return np.exp(-0.5 * z ** 2).sum(axis=1) / (a.size * bw * np.sqrt(2 * np.pi))
+
+@pytest.mark.parametrize("name", ["normal", "with_nan"])
+def test_hist_kde_matches_numpy(name):
+    values = COLUMNS[name].astype(np.float32)
+    edges, counts, grid, dens = hist_kde_column(values, "upload", name)
+    a = values[~np.isnan(values)].astype(np.float64)
+    expected_counts, expected_edges = np.histogram(a, bins=len(counts), range=(a.min(), a.max()))
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_allclose(edges, expected_edges)
+    # The KDE is evaluated from fine bins, so allow a small fraction of the peak density
+    ref = _reference_kde(a, grid)
+    np.testing.assert_allclose(dens, ref, rtol=0, atol=1e-3 * ref.max())
+
+def test_hist_kde_density_integrates_to_one():
+    _, _, grid, dens = hist_kde_column(COLUMNS["normal"].astype(np.float32), "upload", "normal")
+    assert np.trapezoid(dens, grid) == pytest.approx(1.0, abs=1e-2)
+
+@pytest.mark.parametrize("name", ["constant", "single"])
+def test_hist_kde_degenerate_column_has_counts_only(name):
+    values = COLUMNS[name].astype(np.float32)
+    edges, counts, grid, dens = hist_kde_column(values, "upload", name)
+    assert counts.sum() == values.size
+    assert len(edges) == len(counts) + 1
+    assert grid.size == 0 and dens.size == 0
+
+def test_hist_kde_all_nan_is_none():
+    assert hist_kde_column(np.full(3, np.nan, dtype=np.float32), "upload", "empty") is None
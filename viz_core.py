@@ -0,0 +1,402 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import math
+import warnings
+from io import BytesIO
+
+# ---------------- THEME ----------------
+APP_CSS = """
+    <style>
+    /* ---------- Global App Styling ---------- */
+    .stApp {
+        background-color: #F1F8E9;
+        font-family: 'Poppins', sans-serif;
+        color: orangered;
+    }
+
+    /* ---------- Sidebar ---------- */
+    section[data-testid="stSidebar"] {
+        background-color: #C8E6C9;
+        border-right: 2px solid #A5D6A7;
+    }
+
+    /* ---------- Headings ---------- */
+    h1, h2, h3, h4 ,p{
+        color: blue;
+        font-weight: 600;
+    }
+
+    /* ---------- Buttons ---------- */
+    button[data-testid="baseButton-secondary"] {
+        background-color: #00897B !important;
+        color: blue !important;
+        border-radius: 8px !important;
+        border: none !important;
+        font-weight: 600 !important;
+    }
+    button[data-testid="baseButton-secondary"]:hover {
+        background-color: #00796B !important;
+    }
+
+    /* ---------- Download Button ---------- */
+    div.stDownloadButton > button {
+        background-color: white;
+        color: white !important;
+        border-radius: 10px;
+        font-weight: 100;
+    }
+    div.stDownloadButton > button:hover {
+        background-color: #00796B;
+    }
+
+    /* ---------- Dataframes ---------- */
+    .stDataFrame {
+        border-radius: 10px !important;
+    }
+
+    /* ---------- Expander ---------- */
+    .streamlit-expanderHeader {
+        background-color: #E8F5E9 !important;
+        font-weight: 600;
+        color: blue !important;
+    }
+
+    /* ---------- Metrics ---------- */
+    [data-testid="stMetricValue"] {
+        color: blue;
+        font-weight: 700;
+    }
+
+    /* ---------- Select Boxes ---------- */
+    div[data-baseweb="select"] > div {
+        background-color: #FFFFFF !important;
+        border-radius: 8px !important;
+        color: #000000 !important;   /* Ensures black text */
+    }
+
+    /* Text inside dropdown menu */
+    div[data-baseweb="popover"] * {
+        color: #000000 !important;
+    }
+
+    /* Dropdown background */
+    div[data-baseweb="popover"] {
+        background-color: #FFFFFF !important;
+    }
+
+    /* ---------- Footer ---------- */
+    footer {
+        visibility: hidden;
+    }
+    </style>
+"""
+
+def apply_theme():
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# ---------------- LOAD DATA ----------------
+# Bounds for every per-upload cache; column-keyed helpers hold several
+# entries per upload, so they get a larger cap
+CACHE_TTL = 3600
+CACHE_MAX_UPLOADS = 8
+CACHE_MAX_COLUMNS = 64
+
+# Streamlit already keys UploadedFile arguments on their name and full
+# content, so re-uploads of the same file hit the cache as they are
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def load_data(uploaded_file):
+    if uploaded_file.name.endswith(".csv"):
+        # Arrow parses the file, but columns come back as numpy dtypes;
+        # seaborn can't draw Arrow date or string columns on the X-axis
+        df = pd.read_csv(uploaded_file, engine="pyarrow")
+    else:
+        df = pd.read_excel(uploaded_file, engine="openpyxl")
+
+    # Downcast numeric columns to the smallest type that holds their values
+    for c in df.columns:
+        if pd.api.types.is_float_dtype(df[c]):
+            df[c] = pd.to_numeric(df[c], downcast="float")
+        elif pd.api.types.is_integer_dtype(df[c]):
+            df[c] = pd.to_numeric(df[c], downcast="integer")
+    return df
+
+# ---------------- CACHED HELPERS ----------------
+# Frame and array arguments are underscored so st.cache_data skips hashing
+# them; large ones are only sampled, which misses edits on a re-upload.
+# The upload's file_id (the same key numeric_view uses) stands in instead.
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def total_nulls(_df, key):
+    return int(_df.isna().to_numpy().sum())
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def null_counts(_df, key):
+    return _df.isna().sum()
+
+def numeric_view(df, key):
+    # Project the numeric columns once per upload; cache_data hands back a
+    # fresh copy of df on every rerun, so the upload's file_id is the key
+    if st.session_state.get("df_id") != key:
+        st.session_state.df_id = key
+        st.session_state.num_cols = df.select_dtypes(include=np.number).columns.tolist()
+        st.session_state.num_arr = df[st.session_state.num_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+    return st.session_state.num_cols, st.session_state.num_arr
+
+GPU_CORR_MIN_SIZE = 1_000_000
+
+@st.cache_resource
+def _cupy():
+    # Imported on the first large correlation; None without CuPy or a usable GPU
+    try:
+        import cupy as cp
+        cp.cuda.runtime.getDeviceCount()
+    except Exception:
+        return None
+    return cp
+
+def _pairwise_corr(a, present):
+    # Like DataFrame.corr(), each pair only uses the rows where both columns
+    # are present; the per-pair sums come from matrix products over the mask
+    w = present.astype(np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        x = np.where(present, a - np.nanmean(a, axis=0, dtype=np.float64), 0.0)
+    n = w.T @ w
+    sx = x.T @ w
+    sxx = (x * x).T @ w
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = sxx - sx ** 2 / n
+        r = (x.T @ x - sx * sx.T / n) / np.sqrt(var * var.T)
+    # Fewer than two shared rows, or a column constant over them, has no correlation
+    ok = (n >= 2) & (var > 1e-12 * sxx) & (var.T > 1e-12 * sxx.T)
+    return np.where(ok, np.clip(r, -1.0, 1.0), np.nan).astype(np.float32)
+
+def fast_corr(a, cols):
+    cols = list(cols)
+    present = ~np.isnan(a)
+    if not present.all():
+        return pd.DataFrame(_pairwise_corr(a, present), index=cols, columns=cols)
+    m = None
+    cp = _cupy() if a.size > GPU_CORR_MIN_SIZE else None
+    if cp is not None:
+        try:
+            m = cp.corrcoef(cp.asarray(a), rowvar=False).get()
+        except Exception:
+            # Any CUDA failure falls back to the numpy path
+            m = None
+    if m is None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = np.corrcoef(a, rowvar=False, dtype=np.float32)
+    return pd.DataFrame(m, index=cols, columns=cols)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def corr(_a, key, cols):
+    return fast_corr(_a, cols)
+
+def top_correlations(C, cols, k=5):
+    # Rank only the strict upper triangle; the matrix is symmetric with a unit diagonal.
+    # Pairs involving a constant column have no correlation and are left out.
+    iu, ju = np.triu_indices(len(cols), k=1)
+    abs_tri = np.abs(C[iu, ju])
+    keep = ~np.isnan(abs_tri)
+    iu, ju, abs_tri = iu[keep], ju[keep], abs_tri[keep]
+    k = min(k, abs_tri.size)
+    idx = np.argpartition(-abs_tri, k - 1)[:k] if k else np.array([], dtype=int)
+    idx = idx[np.argsort(-abs_tri[idx])]
+    # Plain rows rather than a tuple-indexed Series, which would build a MultiIndex
+    return pd.DataFrame({
+        "Feature 1": [cols[i] for i in iu[idx]],
+        "Feature 2": [cols[j] for j in ju[idx]],
+        "|Correlation|": abs_tri[idx],
+    })
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_COLUMNS)
+def value_counts(_df, key, column, top_n=30):
+    return _df[column].value_counts().head(top_n)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def describe(_df, key):
+    num = _df.select_dtypes(include=np.number)
+    # df.describe() also covers datetime/date columns, and with no numeric
+    # columns it describes the rest; leave those frames to pandas
+    if num.shape[1] == 0 or _df.select_dtypes(include=[np.number, "datetime"]).shape[1] != num.shape[1]:
+        return _df.describe()
+    # One pass per statistic over a single array instead of per-column Series ops
+    a = num.to_numpy(dtype=np.float64, na_value=np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        pcts = np.nanpercentile(a, [0, 25, 50, 75, 100], axis=0)
+        mean = np.nanmean(a, axis=0)
+        std = np.nanstd(a, axis=0, ddof=1)
+    cnt = (~np.isnan(a)).sum(axis=0)
+    return pd.DataFrame(
+        np.vstack([cnt, mean, std, pcts]),
+        index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+        columns=num.columns
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_UPLOADS)
+def dtypes(_df, key):
+    return _df.dtypes.astype(str)
+
+# ---------------- HISTOGRAM / KDE KERNEL ----------------
+KDE_GRID_POINTS = 256
+KDE_BINS = 4096
+MAX_HIST_BINS = 100
+
+def _hist_kde(x, lo, hi, nbins, grid, bw):
+    # One pass fills both the display bins and the fine bins the KDE is built from
+    counts = np.zeros(nbins)
+    fine = np.zeros(KDE_BINS)
+    span = hi - lo
+    for i in range(x.size):
+        t = (x[i] - lo) / span
+        counts[min(int(t * nbins), nbins - 1)] += 1
+        fine[min(int(t * KDE_BINS), KDE_BINS - 1)] += 1
+    # Evaluate the KDE over fine-bin centres: O(KDE_BINS * grid) rather than O(n * grid)
+    step = span / KDE_BINS
+    dens = np.zeros(grid.size)
+    for j in range(grid.size):
+        s = 0.0
+        for b in range(KDE_BINS):
+            if fine[b] > 0:
+                z = (grid[j] - (lo + (b + 0.5) * step)) / bw
+                s += fine[b] * math.exp(-0.5 * z * z)
+        dens[j] = s
+    return counts, dens / (x.size * bw * math.sqrt(2 * math.pi))
+
+@st.cache_resource
+def _hist_kde_kernel():
+    # Compiled on first use so cold starts don't pay for importing numba.
+    # Serial on purpose: numba's parallel runtime, once used from
+    # Streamlit's script thread, keeps the process from exiting.
+    from numba import njit
+    return njit(fastmath=True, cache=True)(_hist_kde)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_COLUMNS)
+def hist_kde_column(_a, key, column):
+    a = _a[~np.isnan(_a)].astype(np.float64)
+    if a.size == 0:
+        return None
+    lo, hi = float(a.min()), float(a.max())
+    if lo == hi:
+        hi = lo + 1.0
+    nbins = min(len(np.histogram_bin_edges(a, bins="auto")) - 1, MAX_HIST_BINS)
+    # Silverman's rule of thumb; constant columns get no KDE curve
+    std = a.std(ddof=1) if a.size > 1 else 0.0
+    q1, q3 = np.percentile(a, [25, 75])
+    bw = 0.9 * (min(std, (q3 - q1) / 1.34) or std) * a.size ** -0.2
+    grid = np.linspace(lo, hi, KDE_GRID_POINTS if bw > 0 else 0)
+    counts, dens = _hist_kde_kernel()(a, lo, hi, nbins, grid, bw if bw > 0 else 1.0)
+    edges = np.linspace(lo, hi, nbins + 1)
+    return edges, counts, grid, dens
+
+# ---------------- PLOT HELPERS ----------------
+@st.cache_resource
+def viz_libs():
+    # Deferred until a file is uploaded; seaborn pulls in scipy on import
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return sns, plt
+
+@st.cache_resource
+def style_rc():
+    # Only the keys the style sheet sets; applying the full rcParams costs
+    # several times more than plt.style.use itself
+    import matplotlib as mpl
+    rc = dict(mpl.style.library["seaborn-v0_8-whitegrid"])
+    rc["path.simplify_threshold"] = 1.0
+    return rc
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_COLUMNS)
+def box_stats(_a, key, label):
+    a = _a[~np.isnan(_a)]
+    if a.size == 0:
+        return None
+    q1, med, q3 = np.quantile(a, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    return {
+        "label": label,
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "whislo": a[a >= q1 - 1.5 * iqr].min(),
+        "whishi": a[a <= q3 + 1.5 * iqr].max(),
+        "fliers": [],
+    }
+
+LARGE_ROWS = 20_000
+MAX_LINE_POINTS = 5_000
+HEATMAP_ANNOT_MAX_COLS = 20
+
+def plot_scatter(df, x, y, ax):
+    sns, _ = viz_libs()
+    if len(df) > LARGE_ROWS:
+        xy = df[[x, y]].dropna().to_numpy(dtype=np.float64)
+        ax.hexbin(xy[:, 0], xy[:, 1], gridsize=80, cmap="Greens", mincnt=1)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+    else:
+        sns.scatterplot(data=df, x=x, y=y, ax=ax, color="#00897B")
+
+def plot_line(df, x, y, ax):
+    sns, _ = viz_libs()
+    step = max(1, len(df) // MAX_LINE_POINTS)
+    sns.lineplot(data=df.iloc[::step], x=x, y=y, ax=ax, color="#00897B")
+
+def plot_histogram(a, key, column, ax):
+    result = hist_kde_column(a, key, column)
+    if result is None:
+        return
+    edges, counts, grid, dens = result
+    widths = np.diff(edges)
+    ax.bar(edges[:-1], counts, width=widths, align="edge", color="#00897B", alpha=0.6)
+    # Scale the density to the count axis, as seaborn's histplot(kde=True) does
+    ax.plot(grid, dens * counts.sum() * widths[0], color="#00897B")
+    ax.set_xlabel(column)
+    ax.set_ylabel("Count")
+
+def plot_box(a, key, column, ax):
+    stats = box_stats(a, key, column)
+    if stats is not None:
+        ax.bxp([stats], showfliers=False, patch_artist=True,
+               boxprops={"facecolor": "#00897B"}, medianprops={"color": "white"})
+
+def plot_count(df, key, column, ax):
+    vc = value_counts(df, key, column)
+    ax.bar(vc.index.astype(str), vc.to_numpy(), color="#00897B")
+    ax.set_xlabel(column)
+    ax.set_ylabel("count")
+    ax.tick_params(axis="x", rotation=45)
+
+def plot_heatmap(C, ax):
+    sns, _ = viz_libs()
+    cols = C.columns.tolist()
+    n = len(cols)
+    # Per-cell annotations cost one Text artist each; skip them on wide frames
+    if n > HEATMAP_ANNOT_MAX_COLS:
+        im = ax.imshow(C.to_numpy(), cmap="Greens", vmin=-1, vmax=1, interpolation="nearest")
+        ax.figure.colorbar(im, ax=ax)
+        ax.set_xticks(range(n))
+        ax.set_xticklabels(cols, rotation=90)
+        ax.set_yticks(range(n))
+        ax.set_yticklabels(cols)
+        ax.grid(False)
+    else:
+        sns.heatmap(C, annot=True, cmap="Greens", ax=ax)
+
+# ---------------- PNG EXPORT ----------------
+@st.fragment
+def download_png(fig):
+    # Runs as a fragment so preparing the PNG doesn't rerun the whole app
+    if st.button("🖼️ Prepare PNG"):
+        buf = BytesIO()
+        fig.savefig(buf, format="png", dpi=72, bbox_inches=None, metadata={"Software": None})
+        st.download_button(
+            label="📥 Download Chart as PNG",
+            data=buf.getvalue(),
+            file_name="chart.png",
+            mime="image/png"
+        )